@@ -0,0 +1,96 @@
+import pytest
+from thaiaddress import autocomplete
+from thaiaddress.suggest import build_index
+
+
+def test_autocomplete_subdistrict():
+    suggestions = autocomplete("ต.ศาลา", option="subdistrict", province="นครปฐม")
+    assert suggestions == [
+        {
+            "subdistrict": "ศาลายา",
+            "district": "พุทธมณฑล",
+            "province": "นครปฐม",
+            "zipcode": "73170",
+        }
+    ]
+
+
+@pytest.mark.parametrize("text", ["กทม", "กรุง"])
+def test_autocomplete_bangkok_alias(text):
+    suggestions = autocomplete(text, option="province")
+    assert suggestions == [{"province": "กรุงเทพมหานคร"}]
+
+
+def test_autocomplete_district_prefix():
+    suggestions = autocomplete("เขตพระนคร", option="district")
+    assert suggestions[0] == {"district": "พระนคร", "province": "กรุงเทพมหานคร"}
+
+
+def test_autocomplete_zipcode():
+    suggestions = autocomplete("731", option="zipcode", limit=100)
+    assert len(suggestions) > 0
+    assert all(s["zipcode"].startswith("731") for s in suggestions)
+    assert all(s["province"] == "นครปฐม" for s in suggestions)
+
+
+def test_autocomplete_province_filter():
+    suggestions = autocomplete("", option="district", province="จ.นครปฐม")
+    assert {s["district"] for s in suggestions} == {
+        "เมืองนครปฐม",
+        "กำแพงแสน",
+        "นครชัยศรี",
+        "ดอนตูม",
+        "บางเลน",
+        "สามพราน",
+        "พุทธมณฑล",
+    }
+    assert autocomplete("", option="district") == []
+
+
+def test_autocomplete_alternate_name():
+    suggestions = autocomplete("ปอพ", province="ร้อยเอ็ด")
+    assert suggestions == [
+        {
+            "subdistrict": "ปอภาร",
+            "district": "เมืองร้อยเอ็ด",
+            "province": "ร้อยเอ็ด",
+            "zipcode": "45000",
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, option",
+    [
+        ("ต", "subdistrict"),
+        ("ตำบ", "subdistrict"),
+        ("ต.", "subdistrict"),
+        ("แขว", "subdistrict"),
+        ("อำเภ", "district"),
+        ("อำเภอ", "district"),
+        ("เข", "district"),
+        ("จังหว", "province"),
+        ("จ.", "province"),
+    ],
+)
+def test_autocomplete_partial_prefix(text, option):
+    assert len(autocomplete(text, option=option, limit=5)) == 5
+
+
+def test_autocomplete_invalid_option():
+    with pytest.raises(ValueError):
+        autocomplete("ศาลา", option="bogus")
+
+
+def test_autocomplete_limit():
+    assert len(autocomplete("บาง", limit=3)) == 3
+    for limit in [None, -1, "3", True]:
+        with pytest.raises(ValueError):
+            autocomplete("บาง", limit=limit)
+
+
+def test_autocomplete_uses_warm_index():
+    misses = build_index.cache_info().misses
+    autocomplete("บ")
+    autocomplete("บ", option="province")
+    assert build_index.cache_info().misses == misses
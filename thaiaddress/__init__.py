@@ -19,6 +19,7 @@
 __version__ = "0.2.1"
 
 from .parser import parse
+from .suggest import autocomplete
 from .utils import (
     preprocess,
     is_stopword,
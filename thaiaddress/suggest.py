@@ -0,0 +1,217 @@
+import csv
+import re
+import heapq
+import os.path as op
+from bisect import bisect_left
+from functools import lru_cache
+from .utils import LOCATION_TYPOS
+
+
+MODULE_PATH = op.dirname(__file__)
+
+
+def read_address_rows(file_path: str) -> list:
+    """
+    Read location data in CSV and return a list of
+    (subdistrict, district, province, zipcode) tuples
+    """
+    with open(file_path, encoding="utf-8") as f:
+        return [
+            (row["subdistrict"], row["district"], row["province"], row["zipcode"])
+            for row in csv.DictReader(f)
+        ]
+
+
+ADDR_ROWS = read_address_rows(op.join(MODULE_PATH, "data", "thai_address_data.csv"))
+PROVINCES = {row[2] for row in ADDR_ROWS}
+ZIPCODES = {row[3] for row in ADDR_ROWS}
+
+# fields returned for each option, ordered from the chosen level up to province
+FIELDS = {
+    "province": ("province",),
+    "district": ("district", "province"),
+    "subdistrict": ("subdistrict", "district", "province", "zipcode"),
+    "zipcode": ("zipcode", "district", "province"),
+}
+FIELD_INDEX = {"subdistrict": 0, "district": 1, "province": 2, "zipcode": 3}
+# prefixes that users type in front of a location, same as in ``extract_location``
+PREFIXES = {
+    "province": ["จังหวัด", "จ."],
+    "district": ["อำเภอ", "อ.", "เขต"],
+    "subdistrict": ["ตำบล", "ต.", "แขวง"],
+    "zipcode": [],
+}
+PROVINCE_ALIASES = {
+    "กทม": "กรุงเทพมหานคร",
+    "กทม.": "กรุงเทพมหานคร",
+    "กรุงเทพ": "กรุงเทพมหานคร",
+    "กรุงเทพฯ": "กรุงเทพมหานคร",
+}
+MAX_CHAR = "\U0010ffff"
+
+
+def normalize_name(text: str) -> str:
+    """
+    Remove whitespaces and fix common typos in a location name
+    """
+    text = "".join(text.split())
+    for typo, correction in LOCATION_TYPOS.items():
+        text = text.replace(typo, correction)
+    return text
+
+
+def display_name(name: str) -> str:
+    """
+    Clean a location name from the CSV for displaying, e.g.
+    ``ปอภาร  (ปอพาน)`` to ``ปอภาร``
+    """
+    name = re.sub(r"\([^)]*\)", " ", name)
+    return " ".join(name.split())
+
+
+def normalize_query(text: str, option="subdistrict") -> str:
+    """
+    Normalize a typed text and remove location prefixes e.g. ``ต.``,
+    ``อ.``, ``จ.`` so that it can be matched against the prefix index
+    """
+    text = normalize_name(text)
+    for prefix in PREFIXES.get(option, []):
+        if text.startswith(prefix):
+            return text[len(prefix) :]
+    return text
+
+
+@lru_cache(maxsize=256)
+def build_index(option="subdistrict", *, province=None, postal_code=None) -> tuple:
+    """
+    Build a prefix index of locations as sorted arrays of keys and
+    entries. Each entry is a tuple of values following ``FIELDS[option]``.
+
+    Parameters
+    ----------
+    option: str, location level to index. This can be ``province``,
+        ``district``, ``subdistrict``, or ``zipcode``
+    province: str or None, if provided, only index locations within a given province
+    postal_code: str or None, if provided, only index locations within a given zipcode
+
+    Output
+    ------
+    index: tuple of (keys, ranks, entries, ordered), where ``keys`` is sorted,
+        ``ranks[i]``, ``entries[i]`` belong to ``keys[i]``, and ``ordered``
+        is a list of unique entries from the best to the worst rank
+    """
+    columns = [FIELD_INDEX[field] for field in FIELDS[option]]
+    items = set()
+    for row in ADDR_ROWS:
+        if province is not None and row[2] != province:
+            continue
+        if postal_code is not None and row[3] != postal_code:
+            continue
+        entry = tuple(display_name(row[c]) for c in columns)
+        name = row[columns[0]]
+        items.add((normalize_name(name), entry))
+        # alternate names in parentheses e.g. ปอภาร (ปอพาน)
+        for alternate in re.findall(r"\(([^)]+)\)", name):
+            items.add((normalize_name(alternate), entry))
+        if option == "province":
+            for alias, official in PROVINCE_ALIASES.items():
+                if official == name:
+                    items.add((alias, entry))
+
+    items = sorted(items)
+    keys = [key for key, _ in items]
+    ranks = [(len(key), entry) for key, entry in items]
+    entries = [entry for _, entry in items]
+    ordered = sorted(set(entries), key=lambda entry: (len(entry[0]), entry))
+    return keys, ranks, entries, ordered
+
+
+def autocomplete(
+    text: str, option="subdistrict", province=None, postal_code=None, limit=10
+) -> list:
+    """
+    Suggest Thai province, district, subdistrict, or zipcode from a
+    partially typed text using a prefix index. Suggestions are ranked
+    with the shortest (closest to an exact) match first.
+
+    Parameters
+    ----------
+    text: str, partially typed location e.g. ``ต.ศาลา``, ``กทม``, or ``731``
+    option: str, an option to suggest. This can be ``province``,
+        ``district``, ``subdistrict``, or ``zipcode``
+    province: str or None, if provided, we will only suggest
+        locations within a given province
+    postal_code: str or None, if provided, we will only suggest
+        locations within a given zipcode
+    limit: int, maximum number of suggestions
+
+    Output
+    ------
+    suggestions: list of dict, each contains location names from the
+        given option up to province, e.g. for ``subdistrict``
+        ``{"subdistrict": ..., "district": ..., "province": ..., "zipcode": ...}``
+
+    Example
+    -------
+    >>> autocomplete("ต.ศาลายา", province="นครปฐม")
+    [{'subdistrict': 'ศาลายา', 'district': 'พุทธมณฑล', 'province': 'นครปฐม', 'zipcode': '73170'}]
+    """
+    if option not in FIELDS:
+        raise ValueError(
+            "option must be one of %s, got %r" % (", ".join(FIELDS), option)
+        )
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 0:
+        raise ValueError("limit must be a non-negative integer, got %r" % (limit,))
+    if province is not None:
+        province = normalize_query(province, option="province")
+        province = PROVINCE_ALIASES.get(province, province)
+        if province not in PROVINCES:
+            return []
+    if postal_code is not None:
+        postal_code = "".join(postal_code.split())
+        if postal_code not in ZIPCODES:
+            return []
+    name = normalize_name(text)
+    query = normalize_query(text, option=option)
+    # a user is still typing a prefix e.g. อำเภ, so keep showing suggestions
+    typing_prefix = name != "" and any(
+        prefix.startswith(name) for prefix in PREFIXES[option]
+    )
+    if typing_prefix:
+        query = name
+    if query == "" and province is None and postal_code is None:
+        return []
+
+    keys, ranks, entries, ordered = build_index(
+        option, province=province, postal_code=postal_code
+    )
+    if query == "":
+        suggestions = ordered[:limit]
+    else:
+        lo = bisect_left(keys, query)
+        hi = bisect_left(keys, query + MAX_CHAR, lo)
+
+        # an entry can be reached from several keys e.g. กรุงเทพ and กทม
+        best = {}
+        for i in range(lo, hi):
+            entry = entries[i]
+            if entry not in best or ranks[i] < best[entry]:
+                best[entry] = ranks[i]
+        if typing_prefix and len(best) == 0:
+            suggestions = ordered[:limit]
+        else:
+            suggestions = heapq.nsmallest(limit, best, key=best.get)
+    return [dict(zip(FIELDS[option], entry)) for entry in suggestions]
+
+
+def warm_up_indexes():
+    """
+    Build unfiltered indexes up front so that the first keystroke is fast.
+    Arguments are passed the same way as in ``autocomplete`` so that
+    ``lru_cache`` reuses these indexes.
+    """
+    for option in FIELDS:
+        build_index(option, province=None, postal_code=None)
+
+
+warm_up_indexes()
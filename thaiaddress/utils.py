@@ -6,6 +6,13 @@ from pythainlp.util import isthai
 from pythainlp.corpus import thai_stopwords
 
 
+# common misspellings in location names and their corrections
+LOCATION_TYPOS = {
+    "ตฺ": "ต.",
+    "คอหงส์": "คอหงษ์",
+}
+
+
 def remove_emoji(text):
     """
     Remove emojis from a given text
@@ -58,10 +65,10 @@ def clean_location_text(text: str) -> str:
     text = text.replace("อำเภอ", " ")
     text = text.replace("ตำบล", " ")
     text = text.replace("ต.", " ")
-    text = text.replace("ตฺ", "ต.")
     text = text.replace("อ.", " ")
     text = text.replace("จ.", " ")
-    text = text.replace("คอหงส์", "คอหงษ์")
+    for typo, correction in LOCATION_TYPOS.items():
+        text = text.replace(typo, correction)
     text = text.replace("กทม.", "กรุงเทพมหานคร")
     text = text.replace("กทม", "กรุงเทพมหานคร")
     return text